@@ -229,8 +229,9 @@ int main() {
     load();
     if (g.node_count == 0) init();
     
+    /* Process every line on stdin - one process can train a whole file */
     char input[4096];
-    if (fgets(input, sizeof(input), stdin)) {
+    while (fgets(input, sizeof(input), stdin)) {
         route(input);
     }
     
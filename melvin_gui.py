@@ -6,23 +6,33 @@ A proper terminal interface for interacting with Melvin
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
+import re
 import subprocess
 import os
-import threading
+import time
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 class MelvinGUI:
+    # One DFA scan per line instead of five substring searches
+    _DBG_RE = re.compile(r"\[(?:SPREAD|PARAMS|ADJUST|LEARN|CONTROL)\]")
+
     def __init__(self, root):
         self.root = root
         self.root.title("Melvin Terminal")
         self.root.geometry("1000x700")
         
-        # Configure style
-        style = ttk.Style()
-        style.theme_use('default')
-        
         self.melvin_path = "./melvin"
         self.debug_mode = tk.BooleanVar(value=False)
+        # Built once - no per-call copy of the whole environment
+        self._env_normal = os.environ.copy()
+        self._env_debug = {**self._env_normal, 'MELVIN_DEBUG': '1'}
+        # Reused worker pool - no per-request thread creation
+        self.pool = ThreadPoolExecutor(max_workers=2)
+        # Last show_activations result, refreshed after STATE_TTL seconds
+        self._state_cache = (0.0, None)
         self.setup_ui()
         
     def setup_ui(self):
@@ -73,6 +83,17 @@ class MelvinGUI:
             height=20
         )
         self.output_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Configure tags once - they never change
+        self.output_text.tag_config("info", foreground="#6a9fb5")
+        self.output_text.tag_config("success", foreground="#90c978")
+        self.output_text.tag_config("error", foreground="#f44747")
+        self.output_text.tag_config("debug", foreground="#858585")
+        self.output_text.tag_config("result", foreground="#dcdcaa", font=('Monaco', 12, 'bold'))
+
+        # Pending output batched into one idle-time flush
+        self._pending = deque()
+        self._flush_scheduled = False
         
         # Input area
         input_frame = ttk.LabelFrame(main_frame, text="Input", padding="5")
@@ -114,42 +135,52 @@ class MelvinGUI:
         self.write_output("Or use buttons to train from file, show state, etc.\n\n", "info")
         
     def write_output(self, text, tag="normal"):
-        """Write text to output with color coding"""
-        self.output_text.insert(tk.END, text)
-        
-        # Configure tags for colors
-        self.output_text.tag_config("info", foreground="#6a9fb5")
-        self.output_text.tag_config("success", foreground="#90c978")
-        self.output_text.tag_config("error", foreground="#f44747")
-        self.output_text.tag_config("debug", foreground="#858585")
-        self.output_text.tag_config("result", foreground="#dcdcaa", font=('Monaco', 12, 'bold'))
-        
-        # Apply tag to last line
-        last_line = self.output_text.index(tk.END)
-        start = f"{last_line.split('.')[0]}.0"
-        self.output_text.tag_add(tag, start, tk.END)
-        
-        # Auto-scroll
+        """Queue text for output with color coding (flushed at idle)"""
+        self._pending.append((text, tag))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_output)
+
+    MAX_OUTPUT_LINES = 5000
+
+    def _flush_output(self):
+        """Drain all pending output in one pass"""
+        self._flush_scheduled = False
+        while self._pending:
+            text, tag = self._pending.popleft()
+            self.output_text.insert(tk.END, text, tag)
+
+        # Ring buffer: trim the oldest lines so inserts stay O(1)
+        # however long the session runs
+        count = int(self.output_text.index('end-1c').split('.')[0])
+        if count > self.MAX_OUTPUT_LINES:
+            self.output_text.delete('1.0', f'{count - self.MAX_OUTPUT_LINES}.0')
+
+        # Auto-scroll once per batch
         self.output_text.see(tk.END)
-        self.output_text.update()
     
     def send_to_melvin(self, byte_data, show_debug=False):
         """Send bytes to Melvin"""
-        env = os.environ.copy()
-        if show_debug or self.debug_mode.get():
-            env['MELVIN_DEBUG'] = '1'
-        
+        debug = show_debug or self.debug_mode.get()
+        env = self._env_debug if debug else self._env_normal
+
         try:
-            result = subprocess.run(
+            # 64K pipe buffering cuts read round-trips on big replies
+            proc = subprocess.Popen(
                 [self.melvin_path],
-                input=byte_data,
-                capture_output=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 env=env,
-                timeout=10
+                bufsize=65536
             )
-            return result.stdout.decode('utf-8', errors='replace'), \
-                   result.stderr.decode('utf-8', errors='replace')
+            stdout, stderr = proc.communicate(byte_data, timeout=10)
+            # stderr is only shown in debug mode - skip the decode otherwise
+            return stdout.decode('utf-8', errors='replace'), \
+                   stderr.decode('utf-8', errors='replace') if debug else ''
         except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
             return None, "Timeout: Melvin took too long"
         except Exception as e:
             return None, f"Error: {str(e)}"
@@ -164,10 +195,8 @@ class MelvinGUI:
         self.status_var.set("Processing...")
         self.root.update()
         
-        # Run in thread to not block UI
-        thread = threading.Thread(target=self._send_input_thread, args=(text,))
-        thread.daemon = True
-        thread.start()
+        # Run on the pool to not block UI
+        self.pool.submit(self._send_input_thread, text)
     
     def _send_input_thread(self, text):
         """Background thread for sending input"""
@@ -187,9 +216,7 @@ class MelvinGUI:
         self.status_var.set("Querying with debug...")
         self.root.update()
         
-        thread = threading.Thread(target=self._send_query_thread, args=(text,))
-        thread.daemon = True
-        thread.start()
+        self.pool.submit(self._send_query_thread, text)
     
     def _send_query_thread(self, text):
         """Background thread for query"""
@@ -201,8 +228,8 @@ class MelvinGUI:
         """Handle response in main thread"""
         if stderr and is_query:
             self.write_output("\nDebug Info:\n", "debug")
-            for line in stderr.split('\n'):
-                if any(tag in line for tag in ['[SPREAD]', '[PARAMS]', '[ADJUST]', '[LEARN]', '[CONTROL]']):
+            for line in stderr.splitlines():
+                if self._DBG_RE.search(line):
                     self.write_output(f"  {line}\n", "debug")
         
         if stdout and stdout.strip():
@@ -229,70 +256,151 @@ class MelvinGUI:
         self.write_output(f"\n📚 TRAINING FROM: {filepath}\n", "info")
         self.status_var.set("Training...")
         self.root.update()
-        
-        thread = threading.Thread(target=self._train_thread, args=(filepath,))
-        thread.daemon = True
-        thread.start()
+
+        # Progress flows through a queue drained once per 100ms tick
+        # instead of one after() callback per message
+        self._progress_q = queue.SimpleQueue()
+        self._training = True
+        self.root.after(100, self._drain_progress)
+
+        self.pool.submit(self._train_thread, filepath)
+
+    def _progress(self, msg, tag=None, status=None):
+        """Called from the training thread - lock-free handoff to the GUI"""
+        self._progress_q.put((msg, tag, status))
+
+    def _drain_progress(self):
+        """Pump all queued training progress into the GUI in one pass"""
+        runs = []  # consecutive same-tag messages merged into one write
+        status = None
+        while True:
+            try:
+                msg, tag, st = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+            if st:
+                status = st
+            if msg:
+                if runs and runs[-1][0] == tag:
+                    runs[-1][1].append(msg)
+                else:
+                    runs.append((tag, [msg]))
+
+        for tag, texts in runs:
+            self.write_output(''.join(texts), tag)
+        if status:
+            self.status_var.set(status)
+
+        if self._training or not self._progress_q.empty():
+            self.root.after(100, self._drain_progress)
     
     def _train_thread(self, filepath):
         """Background training thread"""
         try:
-            with open(filepath, 'r') as f:
-                lines = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            
-            total = len(lines)
-            self.root.after(0, self.write_output, f"Training on {total} patterns...\n\n", "info")
-            
-            for i, line in enumerate(lines, 1):
-                byte_data = line.encode('utf-8')
-                self.send_to_melvin(byte_data, show_debug=False)
-                
-                if i % 5 == 0 or i == total:
-                    msg = f"  [{i}/{total}] {line[:60]}{'...' if len(line) > 60 else ''}\n"
-                    self.root.after(0, self.write_output, msg, "debug")
-                    self.root.after(0, self.status_var.set, f"Training... {i}/{total}")
-            
-            self.root.after(0, self.write_output, "\n✓ Training complete!\n", "success")
-            self.root.after(0, self.status_var.set, "Training complete")
-            
+            env = self._env_debug if self.debug_mode.get() else self._env_normal
+
+            # One melvin process for the whole file - melvin loops over
+            # stdin lines, so training costs a pipe write per pattern
+            # instead of a fork/exec per pattern
+            proc = subprocess.Popen(
+                [self.melvin_path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env
+            )
+
+            # Stream the file in binary: no decode/re-encode round trip
+            # and O(1) memory however long the corpus is
+            count = 0
+            with open(filepath, 'rb') as f:
+                for raw in f:
+                    line = raw.strip()
+                    if not line or line[:1] == b'#':
+                        continue
+                    proc.stdin.write(line + b"\n")
+                    count += 1
+
+                    if count % 5 == 0:
+                        preview = line[:60].decode('utf-8', errors='replace')
+                        dots = '...' if len(line) > 60 else ''
+                        self._progress(f"  [{count}] {preview}{dots}\n",
+                                       "debug", f"Training... {count}")
+
+            proc.stdin.close()
+            proc.wait(timeout=60)
+
+            self._progress(f"\n✓ Training complete! ({count} patterns)\n",
+                           "success", "Training complete")
+
         except Exception as e:
-            self.root.after(0, self.write_output, f"\n✗ Error: {e}\n", "error")
-            self.root.after(0, self.status_var.set, "Error")
+            self._progress(f"\n✗ Error: {e}\n", "error", "Error")
+        finally:
+            self._training = False
     
+    STATE_TTL = 2.0  # seconds before show_activations is rerun
+
     def show_state(self):
         """Show current graph state"""
         self.write_output("\n📊 GRAPH STATE:\n", "info")
         self.status_var.set("Reading graph state...")
-        
+
         try:
-            result = subprocess.run(
-                ["./show_activations"],
-                capture_output=True,
-                timeout=2
-            )
-            output = result.stdout.decode('utf-8', errors='replace')
-            
-            # Parse and display nicely
-            lines = output.split('\n')
-            non_control = [l for l in lines if l.strip() and not '_' in l.split(':')[0] if ':' in l]
-            control = [l for l in lines if '_' in l.split(':')[0] if ':' in l]
-            
+            # Serve repeated clicks from the cache instead of
+            # re-spawning show_activations each time
+            ts, cached = self._state_cache
+            if cached is not None and time.monotonic() - ts < self.STATE_TTL:
+                control, non_control = cached
+            else:
+                control, non_control = self._read_state()
+                self._state_cache = (time.monotonic(), (control, non_control))
+
             if control:
                 self.write_output("\nControl Parameters:\n", "info")
-                for line in control[:10]:
+                for line in control:
                     self.write_output(f"  {line}\n", "debug")
-            
+
             if non_control:
                 self.write_output("\nTop Activations:\n", "info")
-                for line in non_control[:15]:
+                for line in non_control:
                     self.write_output(f"  {line}\n", "normal")
-            
+
             self.status_var.set("Ready")
-            
+
         except Exception as e:
             self.write_output(f"✗ Could not read graph: {e}\n", "error")
             self.status_var.set("Error")
-    
+
+    def _read_state(self):
+        """Run show_activations, classifying each line in one pass"""
+        # Stream the output and stop as soon as the UI has all it
+        # can display
+        proc = subprocess.Popen(
+            ["./show_activations"],
+            stdout=subprocess.PIPE,
+            text=True,
+            errors='replace'
+        )
+        control = []
+        non_control = []
+        try:
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if not line.strip() or ':' not in line:
+                    continue
+                if '_' in line.split(':', 1)[0]:
+                    if len(control) < 10:
+                        control.append(line)
+                elif len(non_control) < 15:
+                    non_control.append(line)
+                if len(control) >= 10 and len(non_control) >= 15:
+                    proc.terminate()
+                    break
+        finally:
+            proc.stdout.close()
+            proc.wait(timeout=2)
+        return control, non_control
+
     def clear_graph(self):
         """Clear the graph"""
         if messagebox.askyesno("Clear Graph", "Are you sure you want to clear graph.mmap?"):